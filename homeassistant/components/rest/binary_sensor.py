@@ -37,6 +37,8 @@ PLATFORM_SCHEMA = vol.All(
     cv.has_at_least_one_key(CONF_RESOURCE, CONF_RESOURCE_TEMPLATE), PLATFORM_SCHEMA
 )
 
+TRUE_STRINGS = frozenset({"true", "on", "open", "yes"})
+
 
 async def async_setup_platform(
     hass: HomeAssistant,
@@ -126,9 +128,4 @@ class RestBinarySensor(RestEntity, TemplateEntity, BinarySensorEntity):
         try:
             self._attr_is_on = bool(int(response))
         except ValueError:
-            self._attr_is_on = {
-                "true": True,
-                "on": True,
-                "open": True,
-                "yes": True,
-            }.get(response.lower(), False)
+            self._attr_is_on = response.lower() in TRUE_STRINGS
@@ -1,5 +1,4 @@
 """The tests for mqtt select component."""
-import copy
 import json
 from typing import Any
 from unittest.mock import patch
@@ -21,7 +20,6 @@ from homeassistant.const import (
     Platform,
 )
 from homeassistant.core import HomeAssistant, State
-from homeassistant.setup import async_setup_component
 
 from .test_common import (
     help_test_availability_when_connection_lost,
@@ -66,98 +64,147 @@ DEFAULT_CONFIG = {
     }
 }
 
+# Discovery payloads serialized once at import time
+DISCOVERY_PAYLOAD_DEFAULT = json.dumps(DEFAULT_CONFIG[mqtt.DOMAIN][select.DOMAIN])
+DISCOVERY_PAYLOAD_BEER = json.dumps(
+    {
+        "name": "Beer",
+        "state_topic": "test-topic",
+        "command_topic": "test-topic",
+        "options": ["milk", "beer"],
+    }
+)
+DISCOVERY_PAYLOAD_MILK = json.dumps(
+    {
+        "name": "Milk",
+        "state_topic": "test-topic",
+        "command_topic": "test-topic",
+        "options": ["milk", "beer"],
+    }
+)
+DISCOVERY_PAYLOAD_MILK_REDUCED = json.dumps(
+    {
+        "name": "Milk",
+        "state_topic": "test-topic",
+        "command_topic": "test-topic",
+        "options": ["beer"],
+    }
+)
+
+# Pre-encoded value_template payloads, fired as-is without a per-call encode
+PAYLOAD_TEMPLATE_MILK = b'{"val":"milk"}'
+PAYLOAD_TEMPLATE_BEER = b'{"val":"beer"}'
+PAYLOAD_TEMPLATE_NULL = b'{"val": null}'
+
+COMMAND_TEMPLATE = '{"option": "{{ value }}"}'
+VALUE_TEMPLATE = "{{ value_json.val }}"
+
+
+@pytest.fixture(scope="session")
+def default_config_template() -> str:
+    """Serialize DEFAULT_CONFIG once for fast per-test copies."""
+    return json.dumps(DEFAULT_CONFIG)
+
+
+@pytest.fixture
+def default_config(default_config_template: str) -> dict[str, Any]:
+    """Return a fresh mutable copy of DEFAULT_CONFIG."""
+    return json.loads(default_config_template)
+
 
 @pytest.fixture(autouse=True)
-def select_platform_only():
+def select_platform_only(monkeypatch: pytest.MonkeyPatch) -> None:
     """Only setup the select platform to speed up tests."""
-    with patch("homeassistant.components.mqtt.PLATFORMS", [Platform.SELECT]):
-        yield
+    monkeypatch.setattr("homeassistant.components.mqtt.PLATFORMS", [Platform.SELECT])
 
 
-async def test_run_select_setup(
-    hass: HomeAssistant, mqtt_mock_entry_with_yaml_config: MqttMockHAClientGenerator
+async def fire_mqtt_messages(
+    hass: HomeAssistant, messages: list[tuple[str, str | bytes]]
 ) -> None:
-    """Test that it fetches the given payload."""
-    topic = "test/select"
-    await async_setup_component(
-        hass,
-        mqtt.DOMAIN,
+    """Fire a batch of MQTT messages and drain the event loop once."""
+    for topic, payload in messages:
+        async_fire_mqtt_message(hass, topic, payload)
+    await hass.async_block_till_done()
+
+
+@pytest.mark.parametrize(
+    "hass_config",
+    [
         {
             mqtt.DOMAIN: {
-                select.DOMAIN: {
-                    "state_topic": topic,
-                    "command_topic": topic,
-                    "name": "Test Select",
-                    "options": ["milk", "beer"],
-                }
+                select.DOMAIN: [
+                    {
+                        "state_topic": "test/select",
+                        "command_topic": "test/select",
+                        "name": "Test Select",
+                        "options": ["milk", "beer"],
+                    },
+                    {
+                        "state_topic": "test/select-template",
+                        "command_topic": "test/select-template",
+                        "name": "Test Select Template",
+                        "options": ["milk", "beer"],
+                        "value_template": VALUE_TEMPLATE,
+                    },
+                ]
             }
-        },
-    )
-    await hass.async_block_till_done()
-    await mqtt_mock_entry_with_yaml_config()
+        }
+    ],
+)
+async def test_run_select_setup(
+    hass: HomeAssistant,
+    caplog: pytest.LogCaptureFixture,
+    mqtt_mock_entry_no_yaml_config: MqttMockHAClientGenerator,
+) -> None:
+    """Test handling of incoming payloads, with and without a value template."""
+    topic = "test/select"
+    template_topic = "test/select-template"
+    await mqtt_mock_entry_no_yaml_config()
 
-    async_fire_mqtt_message(hass, topic, "milk")
+    await fire_mqtt_messages(
+        hass, [(topic, "milk"), (template_topic, PAYLOAD_TEMPLATE_MILK)]
+    )
 
-    await hass.async_block_till_done()
+    assert hass.states.get("select.test_select").state == "milk"
+    assert hass.states.get("select.test_select_template").state == "milk"
 
-    state = hass.states.get("select.test_select")
-    assert state.state == "milk"
+    await fire_mqtt_messages(
+        hass, [(topic, "beer"), (template_topic, PAYLOAD_TEMPLATE_BEER)]
+    )
 
-    async_fire_mqtt_message(hass, topic, "beer")
+    assert hass.states.get("select.test_select").state == "beer"
+    assert hass.states.get("select.test_select_template").state == "beer"
 
-    await hass.async_block_till_done()
+    # a payload that is not a valid option is rejected with a warning,
+    # a null templated value resets the state to unknown
+    await fire_mqtt_messages(
+        hass, [(topic, "öl"), (template_topic, PAYLOAD_TEMPLATE_NULL)]
+    )
 
-    state = hass.states.get("select.test_select")
-    assert state.state == "beer"
+    assert hass.states.get("select.test_select").state == "beer"
+    assert (
+        "Invalid option for select.test_select: 'öl' (valid options: ['milk', 'beer'])"
+        in caplog.text
+    )
+    assert hass.states.get("select.test_select_template").state == STATE_UNKNOWN
 
 
-async def test_value_template(
-    hass: HomeAssistant, mqtt_mock_entry_with_yaml_config: MqttMockHAClientGenerator
-) -> None:
-    """Test that it fetches the given payload with a template."""
-    topic = "test/select"
-    await async_setup_component(
-        hass,
-        mqtt.DOMAIN,
+@pytest.mark.parametrize(
+    "hass_config",
+    [
         {
             mqtt.DOMAIN: {
                 select.DOMAIN: {
-                    "state_topic": topic,
-                    "command_topic": topic,
+                    "command_topic": "test/select",
                     "name": "Test Select",
                     "options": ["milk", "beer"],
-                    "value_template": "{{ value_json.val }}",
                 }
             }
-        },
-    )
-    await hass.async_block_till_done()
-    await mqtt_mock_entry_with_yaml_config()
-
-    async_fire_mqtt_message(hass, topic, '{"val":"milk"}')
-
-    await hass.async_block_till_done()
-
-    state = hass.states.get("select.test_select")
-    assert state.state == "milk"
-
-    async_fire_mqtt_message(hass, topic, '{"val":"beer"}')
-
-    await hass.async_block_till_done()
-
-    state = hass.states.get("select.test_select")
-    assert state.state == "beer"
-
-    async_fire_mqtt_message(hass, topic, '{"val": null}')
-
-    await hass.async_block_till_done()
-
-    state = hass.states.get("select.test_select")
-    assert state.state == STATE_UNKNOWN
-
-
+        }
+    ],
+)
 async def test_run_select_service_optimistic(
-    hass: HomeAssistant, mqtt_mock_entry_with_yaml_config: MqttMockHAClientGenerator
+    hass: HomeAssistant, mqtt_mock_entry_no_yaml_config: MqttMockHAClientGenerator
 ) -> None:
     """Test that set_value service works in optimistic mode."""
     topic = "test/select"
@@ -165,21 +212,7 @@ async def test_run_select_service_optimistic(
     fake_state = State("select.test_select", "milk")
     mock_restore_cache(hass, (fake_state,))
 
-    assert await async_setup_component(
-        hass,
-        mqtt.DOMAIN,
-        {
-            mqtt.DOMAIN: {
-                select.DOMAIN: {
-                    "command_topic": topic,
-                    "name": "Test Select",
-                    "options": ["milk", "beer"],
-                }
-            }
-        },
-    )
-    await hass.async_block_till_done()
-    mqtt_mock = await mqtt_mock_entry_with_yaml_config()
+    mqtt_mock = await mqtt_mock_entry_no_yaml_config()
 
     state = hass.states.get("select.test_select")
     assert state.state == "milk"
@@ -198,8 +231,23 @@ async def test_run_select_service_optimistic(
     assert state.state == "beer"
 
 
+@pytest.mark.parametrize(
+    "hass_config",
+    [
+        {
+            mqtt.DOMAIN: {
+                select.DOMAIN: {
+                    "command_topic": "test/select",
+                    "name": "Test Select",
+                    "options": ["milk", "beer"],
+                    "command_template": COMMAND_TEMPLATE,
+                }
+            }
+        }
+    ],
+)
 async def test_run_select_service_optimistic_with_command_template(
-    hass: HomeAssistant, mqtt_mock_entry_with_yaml_config: MqttMockHAClientGenerator
+    hass: HomeAssistant, mqtt_mock_entry_no_yaml_config: MqttMockHAClientGenerator
 ) -> None:
     """Test that set_value service works in optimistic mode and with a command_template."""
     topic = "test/select"
@@ -207,22 +255,7 @@ async def test_run_select_service_optimistic_with_command_template(
     fake_state = State("select.test_select", "milk")
     mock_restore_cache(hass, (fake_state,))
 
-    assert await async_setup_component(
-        hass,
-        mqtt.DOMAIN,
-        {
-            mqtt.DOMAIN: {
-                select.DOMAIN: {
-                    "command_topic": topic,
-                    "name": "Test Select",
-                    "options": ["milk", "beer"],
-                    "command_template": '{"option": "{{ value }}"}',
-                }
-            }
-        },
-    )
-    await hass.async_block_till_done()
-    mqtt_mock = await mqtt_mock_entry_with_yaml_config()
+    mqtt_mock = await mqtt_mock_entry_no_yaml_config()
 
     state = hass.states.get("select.test_select")
     assert state.state == "milk"
@@ -243,29 +276,29 @@ async def test_run_select_service_optimistic_with_command_template(
     assert state.state == "beer"
 
 
-async def test_run_select_service(
-    hass: HomeAssistant, mqtt_mock_entry_with_yaml_config: MqttMockHAClientGenerator
-) -> None:
-    """Test that set_value service works in non optimistic mode."""
-    cmd_topic = "test/select/set"
-    state_topic = "test/select"
-
-    assert await async_setup_component(
-        hass,
-        mqtt.DOMAIN,
+@pytest.mark.parametrize(
+    "hass_config",
+    [
         {
             mqtt.DOMAIN: {
                 select.DOMAIN: {
-                    "command_topic": cmd_topic,
-                    "state_topic": state_topic,
+                    "command_topic": "test/select/set",
+                    "state_topic": "test/select",
                     "name": "Test Select",
                     "options": ["milk", "beer"],
                 }
             }
-        },
-    )
-    await hass.async_block_till_done()
-    mqtt_mock = await mqtt_mock_entry_with_yaml_config()
+        }
+    ],
+)
+async def test_run_select_service(
+    hass: HomeAssistant, mqtt_mock_entry_no_yaml_config: MqttMockHAClientGenerator
+) -> None:
+    """Test that set_value service works in non optimistic mode."""
+    cmd_topic = "test/select/set"
+    state_topic = "test/select"
+
+    mqtt_mock = await mqtt_mock_entry_no_yaml_config()
 
     async_fire_mqtt_message(hass, state_topic, "beer")
     state = hass.states.get("select.test_select")
@@ -282,30 +315,30 @@ async def test_run_select_service(
     assert state.state == "beer"
 
 
-async def test_run_select_service_with_command_template(
-    hass: HomeAssistant, mqtt_mock_entry_with_yaml_config: MqttMockHAClientGenerator
-) -> None:
-    """Test that set_value service works in non optimistic mode and with a command_template."""
-    cmd_topic = "test/select/set"
-    state_topic = "test/select"
-
-    assert await async_setup_component(
-        hass,
-        mqtt.DOMAIN,
+@pytest.mark.parametrize(
+    "hass_config",
+    [
         {
             mqtt.DOMAIN: {
                 select.DOMAIN: {
-                    "command_topic": cmd_topic,
-                    "state_topic": state_topic,
+                    "command_topic": "test/select/set",
+                    "state_topic": "test/select",
                     "name": "Test Select",
                     "options": ["milk", "beer"],
-                    "command_template": '{"option": "{{ value }}"}',
+                    "command_template": COMMAND_TEMPLATE,
                 }
             }
-        },
-    )
-    await hass.async_block_till_done()
-    mqtt_mock = await mqtt_mock_entry_with_yaml_config()
+        }
+    ],
+)
+async def test_run_select_service_with_command_template(
+    hass: HomeAssistant, mqtt_mock_entry_no_yaml_config: MqttMockHAClientGenerator
+) -> None:
+    """Test that set_value service works in non optimistic mode and with a command_template."""
+    cmd_topic = "test/select/set"
+    state_topic = "test/select"
+
+    mqtt_mock = await mqtt_mock_entry_no_yaml_config()
 
     async_fire_mqtt_message(hass, state_topic, "beer")
     state = hass.states.get("select.test_select")
@@ -474,7 +507,7 @@ async def test_discovery_removal_select(
     caplog: pytest.LogCaptureFixture,
 ) -> None:
     """Test removal of discovered select."""
-    data = json.dumps(DEFAULT_CONFIG[mqtt.DOMAIN][select.DOMAIN])
+    data = DISCOVERY_PAYLOAD_DEFAULT
     await help_test_discovery_removal(
         hass, mqtt_mock_entry_no_yaml_config, caplog, select.DOMAIN, data
     )
@@ -510,7 +543,7 @@ async def test_discovery_update_unchanged_select(
     caplog: pytest.LogCaptureFixture,
 ) -> None:
     """Test update of discovered select."""
-    data1 = '{ "name": "Beer", "state_topic": "test-topic", "command_topic": "test-topic", "options": ["milk", "beer"]}'
+    data1 = DISCOVERY_PAYLOAD_BEER
     with patch(
         "homeassistant.components.mqtt.select.MqttSelect.discovery_update"
     ) as discovery_update:
@@ -532,7 +565,7 @@ async def test_discovery_broken(
 ) -> None:
     """Test handling of bad discovery message."""
     data1 = '{ "name": "Beer" }'
-    data2 = '{ "name": "Milk", "state_topic": "test-topic", "command_topic": "test-topic", "options": ["milk", "beer"]}'
+    data2 = DISCOVERY_PAYLOAD_MILK
 
     await help_test_discovery_broken(
         hass, mqtt_mock_entry_no_yaml_config, caplog, select.DOMAIN, data1, data2
@@ -609,69 +642,37 @@ async def test_entity_debug_info_message(
     )
 
 
-@pytest.mark.parametrize("options", [["milk", "beer"], ["milk"], []])
+@pytest.mark.parametrize(
+    ("hass_config", "options"),
+    [
+        (
+            {
+                mqtt.DOMAIN: {
+                    select.DOMAIN: {
+                        "state_topic": "test/select",
+                        "command_topic": "test/select",
+                        "name": "Test select",
+                        "options": options,
+                    }
+                }
+            },
+            options,
+        )
+        for options in (["milk", "beer"], ["milk"], [])
+    ],
+)
 async def test_options_attributes(
     hass: HomeAssistant,
-    mqtt_mock_entry_with_yaml_config: MqttMockHAClientGenerator,
-    options,
+    mqtt_mock_entry_no_yaml_config: MqttMockHAClientGenerator,
+    options: list[str],
 ) -> None:
     """Test options attribute."""
-    topic = "test/select"
-    await async_setup_component(
-        hass,
-        mqtt.DOMAIN,
-        {
-            mqtt.DOMAIN: {
-                select.DOMAIN: {
-                    "state_topic": topic,
-                    "command_topic": topic,
-                    "name": "Test select",
-                    "options": options,
-                }
-            }
-        },
-    )
-    await hass.async_block_till_done()
-    await mqtt_mock_entry_with_yaml_config()
+    await mqtt_mock_entry_no_yaml_config()
 
     state = hass.states.get("select.test_select")
     assert state.attributes.get(ATTR_OPTIONS) == options
 
 
-async def test_mqtt_payload_not_an_option_warning(
-    hass: HomeAssistant,
-    caplog: pytest.LogCaptureFixture,
-    mqtt_mock_entry_with_yaml_config: MqttMockHAClientGenerator,
-) -> None:
-    """Test warning for MQTT payload which is not a valid option."""
-    topic = "test/select"
-    await async_setup_component(
-        hass,
-        mqtt.DOMAIN,
-        {
-            mqtt.DOMAIN: {
-                select.DOMAIN: {
-                    "state_topic": topic,
-                    "command_topic": topic,
-                    "name": "Test Select",
-                    "options": ["milk", "beer"],
-                }
-            }
-        },
-    )
-    await hass.async_block_till_done()
-    await mqtt_mock_entry_with_yaml_config()
-
-    async_fire_mqtt_message(hass, topic, "öl")
-
-    await hass.async_block_till_done()
-
-    assert (
-        "Invalid option for select.test_select: 'öl' (valid options: ['milk', 'beer'])"
-        in caplog.text
-    )
-
-
 @pytest.mark.parametrize(
     ("service", "topic", "parameters", "payload", "template"),
     [
@@ -693,10 +694,11 @@ async def test_publishing_with_custom_encoding(
     parameters: dict[str, Any],
     payload: str,
     template: str | None,
+    default_config: dict[str, Any],
 ) -> None:
     """Test publishing MQTT payload with different encoding."""
     domain = select.DOMAIN
-    config = DEFAULT_CONFIG
+    config = default_config
     config[mqtt.DOMAIN][domain]["options"] = ["milk", "beer"]
 
     await help_test_publishing_with_custom_encoding(
@@ -737,9 +739,10 @@ async def test_encoding_subscribable_topics(
     value: str,
     attribute: str | None,
     attribute_value: Any,
+    default_config: dict[str, Any],
 ) -> None:
     """Test handling of incoming encoded payload."""
-    config = copy.deepcopy(DEFAULT_CONFIG[mqtt.DOMAIN][select.DOMAIN])
+    config = default_config[mqtt.DOMAIN][select.DOMAIN]
     config["options"] = ["milk", "beer"]
     await help_test_encoding_subscribable_topics(
         hass,
@@ -780,7 +783,7 @@ async def test_persistent_state_after_reconfig(
 ) -> None:
     """Test of the state is persistent after reconfiguring the select options."""
     await mqtt_mock_entry_no_yaml_config()
-    discovery_data = '{ "name": "Milk", "state_topic": "test-topic", "command_topic": "test-topic", "options": ["milk", "beer"]}'
+    discovery_data = DISCOVERY_PAYLOAD_MILK
     await help_test_discovery_setup(hass, SELECT_DOMAIN, discovery_data, "milk")
 
     # assign an initial state
@@ -790,7 +793,7 @@ async def test_persistent_state_after_reconfig(
     assert state.attributes["options"] == ["milk", "beer"]
 
     # remove "milk" option
-    discovery_data = '{ "name": "Milk", "state_topic": "test-topic", "command_topic": "test-topic", "options": ["beer"]}'
+    discovery_data = DISCOVERY_PAYLOAD_MILK_REDUCED
     await help_test_discovery_setup(hass, SELECT_DOMAIN, discovery_data, "milk")
 
     # assert the state persistent
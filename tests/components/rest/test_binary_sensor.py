@@ -1,10 +1,13 @@
 """The tests for the REST binary sensor platform."""
 
 import asyncio
+from collections.abc import Generator
 from http import HTTPStatus
-from unittest.mock import MagicMock, patch
+from typing import Any
+from unittest.mock import MagicMock
 
 import httpx
+import orjson
 import pytest
 import respx
 
@@ -26,6 +29,64 @@ from homeassistant.setup import async_setup_component
 
 from tests.common import get_fixture_path
 
+# URL parsed once and reused by every route registration
+LOCALHOST_URL = httpx.URL("http://localhost")
+
+# Static response bodies, encoded once at import time
+EMPTY_JSON_BODY = orjson.dumps({})
+DOG_OFF_BODY = orjson.dumps({"dog": False})
+DOG_ON_BODY = orjson.dumps({"dog": True})
+DOG_YES_BODY = orjson.dumps({"dog": "YES"})
+
+
+# Shared platform config fragments, validated shapes built once
+BASE_CONFIG = {
+    "platform": "rest",
+    "resource": "http://localhost",
+    "method": "GET",
+}
+FULL_CONFIG = {
+    **BASE_CONFIG,
+    "value_template": "{{ value_json.key }}",
+    "name": "foo",
+    "verify_ssl": True,
+    "timeout": 30,
+}
+AUTH_CONFIG = {
+    "authentication": "basic",
+    "username": "my username",
+    "password": "my password",
+    "headers": {"Accept": CONTENT_TYPE_JSON},
+}
+
+
+# Request stub shared by every RequestError side effect
+FAKE_REQUEST = MagicMock(spec=httpx.Request)
+
+
+def mock_json_response(
+    body: bytes, content_type: str = CONTENT_TYPE_JSON
+) -> httpx.Response:
+    """Return a canned JSON response built from a pre-encoded body."""
+    return httpx.Response(
+        HTTPStatus.OK, content=body, headers={"content-type": content_type}
+    )
+
+
+@pytest.fixture(autouse=True)
+def respx_mock() -> Generator[respx.MockRouter, None, None]:
+    """Mock httpx calls for every test without a per-test decorator stack."""
+    with respx.mock(assert_all_called=False) as mock_router:
+        yield mock_router
+
+
+@pytest.fixture(scope="module")
+def reload_config() -> dict[str, Any]:
+    """Parse the reload fixture once for the module."""
+    return hass_config.load_yaml_config_file(
+        get_fixture_path("configuration.yaml", "rest")
+    )
+
 
 async def test_setup_missing_basic_config(hass: HomeAssistant) -> None:
     """Test setup with configuration missing required entries."""
@@ -53,35 +114,27 @@ async def test_setup_missing_config(hass: HomeAssistant) -> None:
     assert len(hass.states.async_all("binary_sensor")) == 0
 
 
-@respx.mock
 async def test_setup_failed_connect(
-    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+    hass: HomeAssistant,
+    respx_mock: respx.MockRouter,
+    caplog: pytest.LogCaptureFixture,
 ) -> None:
     """Test setup when connection error occurs."""
 
-    respx.get("http://localhost").mock(
-        side_effect=httpx.RequestError("server offline", request=MagicMock())
+    respx_mock.get(LOCALHOST_URL).mock(
+        side_effect=httpx.RequestError("server offline", request=FAKE_REQUEST)
     )
     assert await async_setup_component(
-        hass,
-        Platform.BINARY_SENSOR,
-        {
-            "binary_sensor": {
-                "platform": "rest",
-                "resource": "http://localhost",
-                "method": "GET",
-            }
-        },
+        hass, Platform.BINARY_SENSOR, {"binary_sensor": BASE_CONFIG}
     )
     await hass.async_block_till_done()
     assert len(hass.states.async_all("binary_sensor")) == 0
     assert "server offline" in caplog.text
 
 
-@respx.mock
-async def test_setup_timeout(hass: HomeAssistant) -> None:
+async def test_setup_timeout(hass: HomeAssistant, respx_mock: respx.MockRouter) -> None:
     """Test setup when connection timeout occurs."""
-    respx.get("http://localhost").mock(side_effect=asyncio.TimeoutError())
+    respx_mock.get(LOCALHOST_URL).mock(side_effect=asyncio.TimeoutError())
     assert await async_setup_component(
         hass,
         Platform.BINARY_SENSOR,
@@ -97,82 +150,91 @@ async def test_setup_timeout(hass: HomeAssistant) -> None:
     assert len(hass.states.async_all("binary_sensor")) == 0
 
 
-@respx.mock
-async def test_setup_minimum(hass: HomeAssistant) -> None:
-    """Test setup with minimum configuration."""
-    respx.get("http://localhost") % HTTPStatus.OK
-    assert await async_setup_component(
-        hass,
-        Platform.BINARY_SENSOR,
-        {
-            "binary_sensor": {
-                "platform": "rest",
-                "resource": "http://localhost",
-                "method": "GET",
-            }
-        },
-    )
-    await hass.async_block_till_done()
-    assert len(hass.states.async_all("binary_sensor")) == 1
-
-
-@respx.mock
-async def test_setup_minimum_resource_template(hass: HomeAssistant) -> None:
-    """Test setup with minimum configuration (resource_template)."""
-    respx.get("http://localhost") % HTTPStatus.OK
-    assert await async_setup_component(
-        hass,
-        Platform.BINARY_SENSOR,
-        {
-            "binary_sensor": {
+@pytest.mark.parametrize(
+    ("method", "params", "config", "expected_count"),
+    [
+        ("GET", None, BASE_CONFIG, 1),
+        (
+            "GET",
+            None,
+            {
                 "platform": "rest",
                 "resource_template": "{% set url = 'http://localhost' %}{{ url }}",
-            }
-        },
-    )
-    await hass.async_block_till_done()
-    assert len(hass.states.async_all("binary_sensor")) == 1
-
-
-@respx.mock
-async def test_setup_duplicate_resource_template(hass: HomeAssistant) -> None:
-    """Test setup with duplicate resources."""
-    respx.get("http://localhost") % HTTPStatus.OK
-    assert await async_setup_component(
-        hass,
-        Platform.BINARY_SENSOR,
-        {
-            "binary_sensor": {
+            },
+            1,
+        ),
+        (
+            "GET",
+            None,
+            {
                 "platform": "rest",
                 "resource": "http://localhost",
                 "resource_template": "http://localhost",
-            }
-        },
+            },
+            0,
+        ),
+        (
+            "GET",
+            None,
+            {**FULL_CONFIG, **AUTH_CONFIG, "authentication": "digest"},
+            1,
+        ),
+        (
+            "POST",
+            None,
+            {
+                **FULL_CONFIG,
+                **AUTH_CONFIG,
+                "method": "POST",
+                "payload": '{ "device": "toaster"}',
+            },
+            1,
+        ),
+        (
+            "GET",
+            {"search": "something"},
+            {**BASE_CONFIG, "params": {"search": "something"}},
+            1,
+        ),
+    ],
+    ids=[
+        "minimum",
+        "minimum_resource_template",
+        "duplicate_resource_template",
+        "get_digest_auth",
+        "post",
+        "query_params",
+    ],
+)
+async def test_setup_config_variants(
+    hass: HomeAssistant,
+    respx_mock: respx.MockRouter,
+    method: str,
+    params: dict[str, str] | None,
+    config: dict[str, Any],
+    expected_count: int,
+) -> None:
+    """Test setup variants that only differ in platform configuration."""
+    respx_mock.request(method, LOCALHOST_URL, params=params).mock(
+        return_value=mock_json_response(EMPTY_JSON_BODY)
+    )
+    assert await async_setup_component(
+        hass, Platform.BINARY_SENSOR, {"binary_sensor": config}
     )
     await hass.async_block_till_done()
-    assert len(hass.states.async_all("binary_sensor")) == 0
+    assert len(hass.states.async_all("binary_sensor")) == expected_count
 
 
-@respx.mock
-async def test_setup_get(hass: HomeAssistant) -> None:
+async def test_setup_get(hass: HomeAssistant, respx_mock: respx.MockRouter) -> None:
     """Test setup with valid configuration."""
-    respx.get("http://localhost").respond(status_code=HTTPStatus.OK, json={})
+    respx_mock.get(LOCALHOST_URL).mock(return_value=mock_json_response(EMPTY_JSON_BODY))
     assert await async_setup_component(
         hass,
         "binary_sensor",
         {
             "binary_sensor": {
-                "platform": "rest",
-                "resource": "http://localhost",
-                "method": "GET",
-                "value_template": "{{ value_json.key }}",
-                "name": "foo",
-                "verify_ssl": "true",
-                "timeout": 30,
-                "authentication": "basic",
-                "username": "my username",
-                "password": "my password",
-                "headers": {"Accept": CONTENT_TYPE_JSON},
+                **FULL_CONFIG,
+                **AUTH_CONFIG,
                 "device_class": BinarySensorDeviceClass.PLUG,
             }
         },
@@ -186,261 +248,147 @@ async def test_setup_get(hass: HomeAssistant) -> None:
     assert state.attributes[ATTR_DEVICE_CLASS] == BinarySensorDeviceClass.PLUG
 
 
-@respx.mock
-async def test_setup_get_template_headers_params(hass: HomeAssistant) -> None:
-    """Test setup with valid configuration."""
-    respx.get("http://localhost").respond(status_code=200, json={})
-    assert await async_setup_component(
-        hass,
-        "sensor",
-        {
-            "sensor": {
-                "platform": "rest",
-                "resource": "http://localhost",
-                "method": "GET",
-                "value_template": "{{ value_json.key }}",
-                "name": "foo",
-                "verify_ssl": "true",
-                "timeout": 30,
-                "headers": {
-                    "Accept": CONTENT_TYPE_JSON,
-                    "User-Agent": "Mozilla/{{ 3 + 2 }}.0",
-                },
-                "params": {
-                    "start": 0,
-                    "end": "{{ 3 + 2 }}",
-                },
-            }
-        },
-    )
-    await async_setup_component(hass, "homeassistant", {})
-    await hass.async_block_till_done()
-
-    assert respx.calls.last.request.headers["Accept"] == CONTENT_TYPE_JSON
-    assert respx.calls.last.request.headers["User-Agent"] == "Mozilla/5.0"
-    assert respx.calls.last.request.url.query == b"start=0&end=5"
-
-
-@respx.mock
-async def test_setup_get_digest_auth(hass: HomeAssistant) -> None:
-    """Test setup with valid configuration."""
-    respx.get("http://localhost").respond(status_code=HTTPStatus.OK, json={})
-    assert await async_setup_component(
-        hass,
-        "binary_sensor",
-        {
-            "binary_sensor": {
-                "platform": "rest",
-                "resource": "http://localhost",
-                "method": "GET",
-                "value_template": "{{ value_json.key }}",
-                "name": "foo",
-                "verify_ssl": "true",
-                "timeout": 30,
-                "authentication": "digest",
-                "username": "my username",
-                "password": "my password",
-                "headers": {"Accept": CONTENT_TYPE_JSON},
-            }
-        },
-    )
-
-    await hass.async_block_till_done()
-    assert len(hass.states.async_all("binary_sensor")) == 1
-
-
-@respx.mock
-async def test_setup_post(hass: HomeAssistant) -> None:
+async def test_setup_get_template_headers_params(
+    hass: HomeAssistant, respx_mock: respx.MockRouter
+) -> None:
     """Test setup with valid configuration."""
-    respx.post("http://localhost").respond(status_code=HTTPStatus.OK, json={})
-    assert await async_setup_component(
-        hass,
-        "binary_sensor",
-        {
-            "binary_sensor": {
-                "platform": "rest",
-                "resource": "http://localhost",
-                "method": "POST",
-                "value_template": "{{ value_json.key }}",
-                "payload": '{ "device": "toaster"}',
-                "name": "foo",
-                "verify_ssl": "true",
-                "timeout": 30,
-                "authentication": "basic",
-                "username": "my username",
-                "password": "my password",
-                "headers": {"Accept": CONTENT_TYPE_JSON},
-            }
-        },
-    )
-    await hass.async_block_till_done()
-    assert len(hass.states.async_all("binary_sensor")) == 1
-
-
-@respx.mock
-async def test_setup_get_off(hass: HomeAssistant) -> None:
-    """Test setup with valid off configuration."""
-    respx.get("http://localhost").respond(
-        status_code=HTTPStatus.OK,
-        headers={"content-type": "text/json"},
-        json={"dog": False},
-    )
-    assert await async_setup_component(
-        hass,
-        "binary_sensor",
-        {
-            "binary_sensor": {
-                "platform": "rest",
-                "resource": "http://localhost",
-                "method": "GET",
-                "value_template": "{{ value_json.dog }}",
-                "name": "foo",
-                "verify_ssl": "true",
-                "timeout": 30,
-            }
-        },
+    respx_mock.get(LOCALHOST_URL).mock(return_value=mock_json_response(EMPTY_JSON_BODY))
+    # the sensor and homeassistant setups are independent, overlap them
+    sensor_ok, _ = await asyncio.gather(
+        async_setup_component(
+            hass,
+            "sensor",
+            {
+                "sensor": {
+                    **FULL_CONFIG,
+                    "headers": {
+                        "Accept": CONTENT_TYPE_JSON,
+                        "User-Agent": "Mozilla/{{ 3 + 2 }}.0",
+                    },
+                    "params": {
+                        "start": 0,
+                        "end": "{{ 3 + 2 }}",
+                    },
+                }
+            },
+        ),
+        async_setup_component(hass, "homeassistant", {}),
     )
+    assert sensor_ok
     await hass.async_block_till_done()
-    assert len(hass.states.async_all("binary_sensor")) == 1
 
-    state = hass.states.get("binary_sensor.foo")
-    assert state.state == STATE_OFF
+    assert respx_mock.calls.last.request.headers["Accept"] == CONTENT_TYPE_JSON
+    assert respx_mock.calls.last.request.headers["User-Agent"] == "Mozilla/5.0"
+    assert dict(respx_mock.calls.last.request.url.params) == {"start": "0", "end": "5"}
 
 
-@respx.mock
-async def test_setup_get_on(hass: HomeAssistant) -> None:
-    """Test setup with valid on configuration."""
-    respx.get("http://localhost").respond(
-        status_code=HTTPStatus.OK,
-        headers={"content-type": "text/json"},
-        json={"dog": True},
+@pytest.mark.parametrize(
+    ("body", "expected_state"),
+    [
+        (DOG_OFF_BODY, STATE_OFF),
+        (DOG_ON_BODY, STATE_ON),
+        (DOG_YES_BODY, STATE_ON),
+    ],
+    ids=["off", "on", "truthy_string"],
+)
+async def test_setup_get_state(
+    hass: HomeAssistant, respx_mock: respx.MockRouter, body: bytes, expected_state: str
+) -> None:
+    """Test the rendered state for different response payloads."""
+    respx_mock.get(LOCALHOST_URL).mock(
+        return_value=mock_json_response(body, "text/json")
     )
     assert await async_setup_component(
         hass,
         "binary_sensor",
-        {
-            "binary_sensor": {
-                "platform": "rest",
-                "resource": "http://localhost",
-                "method": "GET",
-                "value_template": "{{ value_json.dog }}",
-                "name": "foo",
-                "verify_ssl": "true",
-                "timeout": 30,
-            }
-        },
+        {"binary_sensor": {**FULL_CONFIG, "value_template": "{{ value_json.dog }}"}},
     )
     await hass.async_block_till_done()
     assert len(hass.states.async_all("binary_sensor")) == 1
 
     state = hass.states.get("binary_sensor.foo")
-    assert state.state == STATE_ON
+    assert state.state == expected_state
 
 
-@respx.mock
-async def test_setup_with_exception(hass: HomeAssistant) -> None:
+async def test_setup_with_exception(
+    hass: HomeAssistant, respx_mock: respx.MockRouter
+) -> None:
     """Test setup with exception."""
-    respx.get("http://localhost").respond(status_code=HTTPStatus.OK, json={})
-    assert await async_setup_component(
-        hass,
-        "binary_sensor",
-        {
-            "binary_sensor": {
-                "platform": "rest",
-                "resource": "http://localhost",
-                "method": "GET",
-                "value_template": "{{ value_json.dog }}",
-                "name": "foo",
-                "verify_ssl": "true",
-                "timeout": 30,
-            }
-        },
+    respx_mock.get(LOCALHOST_URL).mock(return_value=mock_json_response(EMPTY_JSON_BODY))
+    # the binary_sensor and homeassistant setups are independent, overlap them
+    sensor_ok, _ = await asyncio.gather(
+        async_setup_component(
+            hass,
+            "binary_sensor",
+            {
+                "binary_sensor": {
+                    **FULL_CONFIG,
+                    "value_template": "{{ value_json.dog }}",
+                }
+            },
+        ),
+        async_setup_component(hass, "homeassistant", {}),
     )
+    assert sensor_ok
     await hass.async_block_till_done()
     assert len(hass.states.async_all("binary_sensor")) == 1
 
     state = hass.states.get("binary_sensor.foo")
     assert state.state == STATE_OFF
 
-    await async_setup_component(hass, "homeassistant", {})
-    await hass.async_block_till_done()
-
-    respx.clear()
-    respx.get("http://localhost").mock(side_effect=httpx.RequestError)
+    respx_mock.clear()
+    respx_mock.get(LOCALHOST_URL).mock(
+        side_effect=httpx.RequestError("request error", request=FAKE_REQUEST)
+    )
+    # the blocking service call waits for the refresh, no extra drain needed
     await hass.services.async_call(
         "homeassistant",
         "update_entity",
         {ATTR_ENTITY_ID: ["binary_sensor.foo"]},
         blocking=True,
     )
-    await hass.async_block_till_done()
 
     state = hass.states.get("binary_sensor.foo")
     assert state.state == STATE_UNAVAILABLE
 
 
-@respx.mock
-async def test_reload(hass: HomeAssistant) -> None:
+async def test_reload(
+    hass: HomeAssistant,
+    respx_mock: respx.MockRouter,
+    monkeypatch: pytest.MonkeyPatch,
+    reload_config: dict[str, Any],
+) -> None:
     """Verify we can reload reset sensors."""
 
-    respx.get("http://localhost") % HTTPStatus.OK
+    respx_mock.get(LOCALHOST_URL) % HTTPStatus.OK
 
     await async_setup_component(
         hass,
         "binary_sensor",
-        {
-            "binary_sensor": {
-                "platform": "rest",
-                "method": "GET",
-                "name": "mockrest",
-                "resource": "http://localhost",
-            }
-        },
+        {"binary_sensor": {**BASE_CONFIG, "name": "mockrest"}},
     )
     await hass.async_block_till_done()
-    await hass.async_start()
-    await hass.async_block_till_done()
 
     assert len(hass.states.async_all("binary_sensor")) == 1
 
     assert hass.states.get("binary_sensor.mockrest")
 
-    yaml_path = get_fixture_path("configuration.yaml", "rest")
-    with patch.object(hass_config, "YAML_CONFIG_FILE", yaml_path):
-        await hass.services.async_call(
-            "rest",
-            SERVICE_RELOAD,
-            {},
-            blocking=True,
-        )
-        await hass.async_block_till_done()
+    monkeypatch.setattr(
+        hass_config, "load_yaml_config_file", lambda *args: reload_config
+    )
+    # the blocking service call waits for the reload, no extra drain needed
+    await hass.services.async_call(
+        "rest",
+        SERVICE_RELOAD,
+        {},
+        blocking=True,
+    )
 
     assert hass.states.get("binary_sensor.mockreset") is None
     assert hass.states.get("binary_sensor.rollout")
 
 
-@respx.mock
-async def test_setup_query_params(hass: HomeAssistant) -> None:
-    """Test setup with query params."""
-    respx.get("http://localhost", params={"search": "something"}) % HTTPStatus.OK
-    assert await async_setup_component(
-        hass,
-        Platform.BINARY_SENSOR,
-        {
-            "binary_sensor": {
-                "platform": "rest",
-                "resource": "http://localhost",
-                "method": "GET",
-                "params": {"search": "something"},
-            }
-        },
-    )
-    await hass.async_block_till_done()
-    assert len(hass.states.async_all("binary_sensor")) == 1
-
-
-@respx.mock
-async def test_entity_config(hass: HomeAssistant) -> None:
+async def test_entity_config(hass: HomeAssistant, respx_mock: respx.MockRouter) -> None:
     """Test entity configuration."""
 
     config = {
@@ -457,7 +405,7 @@ async def test_entity_config(hass: HomeAssistant) -> None:
         },
     }
 
-    respx.get("http://localhost") % HTTPStatus.OK
+    respx_mock.get(LOCALHOST_URL) % HTTPStatus.OK
     assert await async_setup_component(hass, Platform.BINARY_SENSOR, config)
     await hass.async_block_till_done()
 
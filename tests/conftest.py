@@ -855,6 +855,14 @@ def mqtt_config_entry_data() -> dict[str, Any] | None:
     return None
 
 
+class _FakeMqttInfo:
+    """Class to fake MQTT info."""
+
+    def __init__(self, mid: int) -> None:
+        self.mid = mid
+        self.rc = 0
+
+
 @pytest.fixture
 def mqtt_client_mock(hass: HomeAssistant) -> Generator[MqttMockPahoClient, None, None]:
     """Fixture to mock MQTT client."""
@@ -866,13 +874,6 @@ def mqtt_client_mock(hass: HomeAssistant) -> Generator[MqttMockPahoClient, None,
         mid += 1
         return mid
 
-    class FakeInfo:
-        """Class to fake MQTT info."""
-
-        def __init__(self, mid: int) -> None:
-            self.mid = mid
-            self.rc = 0
-
     with patch("paho.mqtt.client.Client") as mock_client:
 
         @ha.callback
@@ -880,7 +881,7 @@ def mqtt_client_mock(hass: HomeAssistant) -> Generator[MqttMockPahoClient, None,
             async_fire_mqtt_message(hass, topic, payload, qos, retain)
             mid = get_mid()
             mock_client.on_publish(0, 0, mid)
-            return FakeInfo(mid)
+            return _FakeMqttInfo(mid)
 
         def _subscribe(topic, qos=0):
             mid = get_mid()